@@ -1,7 +1,8 @@
 # External Packages
-import functools
 import os
 
+from config.helpers.aws_secrets import clear_project_dotenv_cache
+from config.helpers.base import clear_verified_files
 from config.models.consolidated import AppConfig
 from utils.logging_helpers import get_logger
 
@@ -34,17 +35,51 @@ def map_env_aliases_to_supported_env_vars() -> None:
     map("AWS__AWS_DEFAULT_REGION", "AWS_DEFAULT_REGION")
 
 
-@functools.cache
+# Loaded config, built on the first get_config() call
+_CONFIG: AppConfig | None = None
+
+
 def get_config() -> AppConfig:
-    """Get the app configuration (using secrets, dotenv, config file and environment file)."""
+    """
+    Get the app configuration (using secrets, dotenv, config file and environment file).
+
+    Notes
+    -----
+    The config is built once and kept in a module-level variable, so repeat calls are a single ``is None`` check
+    with no lock or cache-key hashing. Two threads racing on the very first call may both build ``AppConfig``;
+    that is harmless since the result is identical and the last one stored wins.
+    """
+    global _CONFIG
+    config = _CONFIG
+    if config is not None:
+        return config
+
     # Map some common aliases to env variables to supported env variables
     map_env_aliases_to_supported_env_vars()
 
     # Load config from aws secrets, secret files, env, dotenv, yaml and other sources
     config = AppConfig()
 
+    _CONFIG = config
     return config
 
 
+def clear_config_cache() -> None:
+    """
+    Discard the cached configuration so the next ``get_config()`` call rebuilds it.
+
+    Also resets the caches feeding the build: which ``RequiredFile`` paths were verified, so the rebuild re-checks
+    that they still exist, and whether the project ``.env`` file was loaded for the AWS secrets check.
+    """
+    global _CONFIG
+    _CONFIG = None
+    clear_verified_files()
+    clear_project_dotenv_cache()
+
+
+# Keep the functools-style API (`get_config.cache_clear()`) used by tests and tooling
+get_config.cache_clear = clear_config_cache  # pyrefly: ignore  # missing-attribute
+
+
 if __name__ == "__main__":
     logger.info(get_config())
@@ -1,8 +1,9 @@
+import functools
 import os
 
 from dotenv import load_dotenv
 
-from config.helpers.get_project_basedir import get_project_basedir
+from config.helpers.get_project_basedir import PROJECT_BASE_DIR
 
 
 def get_aws_secrets_key() -> str:
@@ -18,6 +19,18 @@ def get_aws_secrets_key() -> str:
     return "<secrets_name>"
 
 
+@functools.cache
+def _load_project_dotenv() -> None:
+    # Runs once per process - every AppConfig() instantiation checks the flag, but the .env file only needs to be
+    # read into os.environ once (load_dotenv never overrides variables that are already set)
+    load_dotenv(PROJECT_BASE_DIR / ".env")
+
+
+def clear_project_dotenv_cache() -> None:
+    """Forget that the project ``.env`` file was loaded, so the next AWS secrets check reads it again."""
+    _load_project_dotenv.cache_clear()
+
+
 def should_use_aws_secrets_as_config_source() -> bool:
     """
     Check if AWS Secrets Manager should be used as a configuration source.
@@ -26,8 +39,13 @@ def should_use_aws_secrets_as_config_source() -> bool:
     -------
     bool
         True if AWS Secrets Manager should be used, False otherwise.
+
+    Notes
+    -----
+    The project ``.env`` file is loaded into ``os.environ`` on the first call only. ``clear_config_cache()``
+    resets this, so the file is read again when the config is rebuilt.
     """
-    load_dotenv(get_project_basedir() / ".env")
+    _load_project_dotenv()
     env = os.environ.get("ENABLE_AWS_SECRETS_CONFIG")
     if env is None:
         enable = False
@@ -1,4 +1,8 @@
+import functools
+import os
+import stat
 from pathlib import Path
+from types import MappingProxyType
 from typing import Annotated, Any
 
 from pydantic import BeforeValidator
@@ -6,40 +10,58 @@ from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
     SettingsConfigDict,
-    YamlConfigSettingsSource,
 )
 
 from config.helpers.aws_secrets import get_aws_secrets_key, should_use_aws_secrets_as_config_source
-from config.helpers.get_project_basedir import get_project_basedir
+from config.helpers.get_project_basedir import PROJECT_BASE_DIR
 from utils.pydantic_aws_secrets_mgr import AWSSecretsManagerSettingsSource
+from utils.pydantic_yaml_cache import CachedYamlConfigSettingsSource
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
-PROJECT_BASE_DIR = get_project_basedir()
-PATH_ENV = Path(PROJECT_BASE_DIR, ".env")
+PATH_ENV = PROJECT_BASE_DIR / ".env"
+PATH_CONFIG_YAML = PROJECT_BASE_DIR / "config.yaml"
 
 
 def convert_to_absolute_path(path: str | Path) -> Path:
     """Convert a Path object to its absolute form (incl expanding user home dir paths) and returns the resolved path."""
     x = Path(path).expanduser()
     if not x.is_absolute():
-        x = Path(get_project_basedir(), path)
+        x = PROJECT_BASE_DIR / x
     return x.resolve()
 
 
 PathLike = str | Path
 AbsolutePath = Annotated[PathLike, BeforeValidator(convert_to_absolute_path)]
 
-DEFAULT_CONFIG_SETTINGS = {
-    # Due to a pydantic bug,case_sensitive has to be set to True. Nested models don't get sourced correctly if False
-    "case_sensitive": True,
-    "arbitrary_types_allowed": False,
-    "env_nested_delimiter": "__",
-    "extra": "ignore",
-    "env_file": (PATH_ENV,),
-    "secrets_dir": "/run/secrets",
-    "validate_by_name": True,
-    "validate_by_alias": True,
-}
+# Read-only view - shared by every model's model_config, so accidental mutation must not leak across models
+DEFAULT_CONFIG_SETTINGS: MappingProxyType[str, Any] = MappingProxyType(
+    {
+        # Due to a pydantic bug,case_sensitive has to be set to True. Nested models don't get sourced correctly if False
+        "case_sensitive": True,
+        "arbitrary_types_allowed": False,
+        "env_nested_delimiter": "__",
+        "extra": "ignore",
+        "env_file": (PATH_ENV,),
+        "secrets_dir": "/run/secrets",
+        "validate_by_name": True,
+        "validate_by_alias": True,
+    }
+)
+
+
+# Settings forwarded to AWSSecretsManagerSettingsSource - derived once here rather than on every AppConfig() build
+_AWS_SECRETS_SOURCE_KWARGS: MappingProxyType[str, Any] = MappingProxyType(
+    {
+        _: DEFAULT_CONFIG_SETTINGS.get(_)
+        for _ in [
+            "case_sensitive",
+            "env_nested_delimiter",
+            "env_parse_enums",
+            "env_parse_none_str",
+            "env_prefix",
+        ]
+    }
+)
 
 
 def get_default_config_settings() -> dict[str, Any]:
@@ -60,7 +82,7 @@ def get_default_config_settings() -> dict[str, Any]:
     - env_file: Path to .env file in project root
     - secrets_dir: "/run/secrets" for Docker secrets support
     """
-    return DEFAULT_CONFIG_SETTINGS
+    return dict(DEFAULT_CONFIG_SETTINGS)
 
 
 class BaseConfigModel(BaseSettings):
@@ -88,35 +110,56 @@ class BaseConfigModel(BaseSettings):
 
         Source - https://docs.pydantic.dev/latest/concepts/pydantic_settings/#changing-priority
         """
-        # Add yaml file as source
+        # Add yaml file as source (parsed once per file version, see CachedYamlConfigSettingsSource)
+        yml_src = CachedYamlConfigSettingsSource(settings_cls=settings_cls, yaml_file=PATH_CONFIG_YAML)
 
-        yml_src = YamlConfigSettingsSource(
-            settings_cls=settings_cls, yaml_file=Path(get_project_basedir(), "config.yaml")
-        )
+        # Skip secret files entirely when no secrets dir exists (CI, non-Docker dev machines) - otherwise
+        # pydantic-settings stats and warns about the missing directory on every build
+        secrets_dir = getattr(file_secret_settings, "secrets_dir", None)
+        secret_srcs = (file_secret_settings,) if _any_path_exists(secrets_dir) else ()
 
         if should_use_aws_secrets_as_config_source():
-            kwargs = {
-                _: DEFAULT_CONFIG_SETTINGS.get(_)
-                for _ in [
-                    "case_sensitive",
-                    "env_nested_delimiter",
-                    "env_parse_enums",
-                    "env_parse_none_str",
-                    "env_prefix",
-                ]
-            }
             aws_secrets_src = AWSSecretsManagerSettingsSource(
                 settings_cls=settings_cls,
                 secret_id=get_aws_secrets_key(),
-                **kwargs,  # pyrefly: ignore  # bad-argument-type
+                **_AWS_SECRETS_SOURCE_KWARGS,  # pyrefly: ignore  # bad-argument-type
             )
-            return env_settings, aws_secrets_src, file_secret_settings, dotenv_settings, yml_src, init_settings
-        return env_settings, file_secret_settings, dotenv_settings, yml_src, init_settings
+            return env_settings, aws_secrets_src, *secret_srcs, dotenv_settings, yml_src, init_settings
+        return env_settings, *secret_srcs, dotenv_settings, yml_src, init_settings
 
 
 # Custom types with validators for common use-cases
 
 
+def _stat_kind(path: Path) -> int:
+    # Single stat() call - st_mode answers both "exists?" and "file or dir?" (0 when the path is missing)
+    try:
+        return os.stat(path).st_mode
+    except OSError:
+        return 0
+
+
+def _any_path_exists(paths: PathLike | list[PathLike] | tuple[PathLike, ...] | None) -> bool:
+    # Existence only - a secrets_dir pointing at a file is left for pydantic-settings to reject
+    if paths is None:
+        return False
+    if isinstance(paths, (str, os.PathLike)):
+        paths = (paths,)
+    return any(_stat_kind(Path(p).expanduser()) for p in paths)
+
+
+@functools.lru_cache(maxsize=64)
+def _verified_file(path: Path) -> Path:
+    # Only successful checks are memoized - a missing file raises, so it is re-checked on the next load
+    assert stat.S_ISREG(_stat_kind(path)), "File not found at path"
+    return path
+
+
+def clear_verified_files() -> None:
+    """Forget which ``RequiredFile`` paths were verified, so the next validation of each one stats it again."""
+    _verified_file.cache_clear()
+
+
 def assert_file_exists(path: Path) -> Path:
     """
     Check if a file exists, and return Path object if True.
@@ -143,9 +186,13 @@ def assert_file_exists(path: Path) -> Path:
     * If path is relative, resolves it against PROJECT_BASE_DIR
     * Verifies the file exists and is a regular file
     * Returns the Path object of the verified file
+
+    Paths that pass the check are remembered for the life of the process, so repeated config loads do not re-stat
+    them. Only ``clear_verified_files()`` forgets them - ``clear_config_cache()`` calls it, but direct
+    ``AppConfig()``/``LookupDataConfig()`` builds do not, so a required file deleted since it was verified still
+    passes until then.
     """
-    assert path.is_file() and path.exists(), "File not found at path"
-    return path
+    return _verified_file(path)
 
 
 def assert_dir_exists(path: Path) -> Path:
@@ -184,11 +231,14 @@ def assert_dir_exists(path: Path) -> Path:
         path.mkdir(exist_ok=True, parents=True)
     except Exception:
         pass
-    assert path.is_dir() and path.exists(), "Not a valid folder"
+    assert stat.S_ISDIR(_stat_kind(path)), "Not a valid folder"
     return path
 
 
 # PathType - Simple wrapper around pathlib.Path - validates if a path exists and is valid
+# RequiredFile memoizes successful checks for the life of the process: a file deleted after it was verified keeps
+# validating (including in direct AppConfig()/LookupDataConfig() builds) until clear_verified_files() is called,
+# which clear_config_cache() does
 RequiredFile = Annotated[
     PathLike,
     BeforeValidator(assert_file_exists),
@@ -1,21 +1,26 @@
+import functools
 import json
 import logging
+from collections.abc import Callable
 from enum import Enum
-from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import yaml
 from pydantic import SecretStr
 from pydantic_core import PydanticUndefinedType
-from ruamel.yaml import YAML
-from ruamel.yaml.comments import CommentedMap
 
 from config import get_config
-from config.helpers.get_project_basedir import get_project_basedir
+from config.helpers.get_project_basedir import PROJECT_BASE_DIR
+from utils.yaml_helpers import YamlSafeDumper
+
+if TYPE_CHECKING:
+    from ruamel.yaml import YAML
+    from ruamel.yaml.comments import CommentedMap
 
 logger = logging.getLogger(__name__)
 
 
-def _build_commented_map(data: dict[str, Any], model_instance: Any, indent: int = 0) -> CommentedMap:
+def _build_commented_map(data: dict[str, Any], model_instance: Any, indent: int = 0) -> "CommentedMap":
     """
     Recursively build a CommentedMap, injecting Pydantic field descriptions as YAML comments.
 
@@ -36,6 +41,8 @@ def _build_commented_map(data: dict[str, Any], model_instance: Any, indent: int
     CommentedMap
         A ruamel.yaml CommentedMap with comments derived from field descriptions.
     """
+    from ruamel.yaml.comments import CommentedMap  # noqa: PLC0415
+
     commented: CommentedMap = CommentedMap()
     # model_fields is a class-level attribute in Pydantic v2
     model_fields = getattr(type(model_instance), "model_fields", {}) if model_instance is not None else {}
@@ -84,7 +91,19 @@ def _build_commented_map(data: dict[str, Any], model_instance: Any, indent: int
     return commented
 
 
-def dump_config_to_yaml(filename: str = "config_dump.yaml", **kwargs) -> None:
+@functools.cache
+def _yaml_dumper() -> "YAML":
+    # YAML() registers all representers/resolvers on construction - configure it once and reuse it.
+    # Deferred import: ruamel.yaml is only needed for YAML exports, not for loading config
+    from ruamel.yaml import YAML  # noqa: PLC0415
+
+    yaml = YAML()
+    yaml.default_flow_style = False
+    yaml.indent(mapping=2, sequence=4, offset=2)
+    return yaml
+
+
+def dump_config_to_yaml(filename: str = "config_dump.yaml", include_comments: bool = True, **kwargs) -> None:
     """
     Dump the current configuration to a YAML file.
 
@@ -96,42 +115,76 @@ def dump_config_to_yaml(filename: str = "config_dump.yaml", **kwargs) -> None:
     filename : str, optional
         The filename to write the configuration to, by default "config_dump.yaml".
         The file will be created in the project base directory.
+    include_comments : bool, optional
+        Whether to write field descriptions as comments, by default True. Without comments the file is written by
+        PyYAML's libyaml-backed dumper, which is considerably faster than the ruamel.yaml round-trip emitter.
+    kwargs: Any
+        Additional keyword arguments to pass to pydantic's model_dump
     """
     config = get_config()
     config_dict = config.model_dump(mode="json", **kwargs)  # Use JSON mode for better serialization
 
-    # Build a CommentedMap so ruamel.yaml preserves the description comments
-    commented_config = _build_commented_map(config_dict, config)
-
-    output_path = Path(get_project_basedir(), filename)
-
-    yaml = YAML()
-    yaml.default_flow_style = False
-    yaml.indent(mapping=2, sequence=4, offset=2)
+    output_path = PROJECT_BASE_DIR / filename
 
     with output_path.open("w") as f:
-        yaml.dump(commented_config, f)
+        if include_comments:
+            # Build a CommentedMap so ruamel.yaml preserves the description comments
+            _yaml_dumper().dump(_build_commented_map(config_dict, config), f)
+        else:
+            # JSON-mode values are plain str/int/float/bool/None/list/dict - no custom representers needed
+            yaml.dump(config_dict, f, Dumper=YamlSafeDumper, default_flow_style=False, sort_keys=False)
 
     logger.info(f"Configuration dumped to: {output_path}")
 
 
+# Formatters for scalar leaf values, keyed on the exact type (bool is listed explicitly - it subclasses int).
+# Booleans are lowercased for dotenv compatibility.
+_SCALAR_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    str: lambda v: v,
+    bool: lambda v: "true" if v else "false",
+    int: str,
+    float: str,
+}
+
+
+def _format_env_value(
+    value: Any,
+    null_value: str | None = None,
+    include_plain_secret_values: bool = False,
+) -> str | None:
+    # Fast path: exact-type lookup for the common scalar leaves instead of an isinstance cascade
+    formatter = _SCALAR_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    if isinstance(value, list):
+        # Convert lists to comma-separated strings
+        return ",".join(map(str, value))
+    if value is None:
+        return null_value
+    if isinstance(value, SecretStr):
+        # Python-mode values keep SecretStr objects, so secrets are recognised without a second model walk
+        return value.get_secret_value() if include_plain_secret_values else str(value)
+    if isinstance(value, Enum):
+        # str-based enums would otherwise be written as e.g. "Member.NAME" rather than their value
+        return str(value.value)
+    return str(value)
+
+
 def _flatten_config_dict(
     config_dict: dict[str, Any],
-    config: Any,
     parent_key: str = "",
     sep: str = "__",
     null_value: str | None = None,
     include_plain_secret_values: bool = False,
-) -> dict[str, str]:
+) -> dict[str, str | None]:
     """
     Flatten a nested dictionary into dotenv format with custom separator.
 
     Parameters
     ----------
     config_dict : Dict[str, Any]
-        The nested configuration dictionary to flatten.
-    config : Any
-        The original pydantic model to access SecretStr objects.
+        The nested configuration dictionary to flatten, as returned by ``model_dump(mode="python")`` so that
+        secrets are still ``SecretStr`` objects.
     parent_key : str, optional
         The parent key prefix, by default ""
     sep : str, optional
@@ -143,49 +196,31 @@ def _flatten_config_dict(
 
     Returns
     -------
-    Dict[str, str]
-        Flattened dictionary with string keys and string values.
+    Dict[str, str | None]
+        Flattened dictionary with string keys and string values (``null_value`` for nulls).
     """
-    items = []
-
-    for key, value in config_dict.items():
-        new_key = f"{parent_key}{sep}{key}" if parent_key else key
+    flat: dict[str, str | None] = {}
+    # Explicit stack of (key prefix, nested dict) instead of recursing per nesting level
+    stack: list[tuple[str, dict[str, Any]]] = [(parent_key, config_dict)]
+
+    while stack:
+        prefix, current_dict = stack.pop()
+        for key, value in current_dict.items():
+            new_key = f"{prefix}{sep}{key}" if prefix else key
+            if isinstance(value, dict):
+                stack.append((new_key, value))
+            else:
+                flat[new_key] = _format_env_value(value, null_value, include_plain_secret_values)
 
-        # Get the original value from the config model
-        config_value = getattr(config, key, None)
+    return flat
 
-        if isinstance(value, dict):
-            items.extend(
-                _flatten_config_dict(
-                    value,
-                    config_value,
-                    new_key,
-                    sep=sep,
-                    null_value=null_value,
-                    include_plain_secret_values=include_plain_secret_values,
-                ).items()
-            )
-        elif isinstance(value, list):
-            # Convert lists to comma-separated strings
-            items.append((new_key, ",".join(str(item) for item in value)))
-        elif value is None:
-            # pyrefly: ignore  # bad-argument-type
-            items.append((new_key, null_value))
-        elif isinstance(value, bool):
-            # Convert boolean to lowercase string for dotenv compatibility
-            items.append((new_key, str(value).lower()))
-        elif isinstance(config_value, SecretStr):
-            # Check if the original value in the config model is a SecretStr
-            if include_plain_secret_values:
-                items.append((new_key, config_value.get_secret_value()))
-            else:
-                items.append((new_key, str(value)))
-        elif isinstance(value, str):
-            items.append((new_key, value))
-        else:
-            items.append((new_key, str(value)))
 
-    return dict(items)
+def _get_flat_config(include_plain_secret_values: bool = False, **kwargs) -> dict[str, str | None]:
+    # Always go through model_dump so serializers, computed fields, aliases and nested models in lists are rendered
+    # the same whether or not dump options are passed. Python mode keeps SecretStr objects so the flattener can
+    # identify secrets directly
+    config_dict = get_config().model_dump(mode="python", **kwargs)
+    return _flatten_config_dict(config_dict, include_plain_secret_values=include_plain_secret_values)
 
 
 def dump_config_to_dotenv(filename: str = ".env.dump", **kwargs) -> None:
@@ -203,21 +238,19 @@ def dump_config_to_dotenv(filename: str = ".env.dump", **kwargs) -> None:
     kwargs: Any
         Additional keyword arguments to pass to pydantic's model_dump
     """
-    config = get_config()
-    config_dict = config.model_dump(mode="json", **kwargs)  # Use JSON mode for better serialization
-
     # Flatten the nested configuration
-    flat_config = _flatten_config_dict(config_dict, config)
+    flat_config = _get_flat_config(**kwargs)
 
-    output_path = Path(get_project_basedir(), filename)
+    output_path = PROJECT_BASE_DIR / filename
 
-    with output_path.open("w") as f:
-        for key, value in sorted(flat_config.items()):
-            # Enclose values containing spaces in single quotes
-            if " " in str(value):
-                f.write(f"{key}='{value}'\n")
-            else:
-                f.write(f"{key}={value}\n")
+    lines = []
+    for key, value in sorted(flat_config.items()):
+        text = str(value)  # Values may be None (null_value)
+        # Enclose values containing spaces in single quotes
+        lines.append(f"{key}='{text}'\n" if " " in text else f"{key}={text}\n")
+
+    # Config is small - build it in memory and issue a single write
+    output_path.write_text("".join(lines))
 
     logger.info(f"Configuration dumped to dotenv format: {output_path}")
 
@@ -246,17 +279,10 @@ def dump_config_to_json(
     kwargs: Any
         Additional keyword arguments to pass to pydantic's model_dump.
     """
-    config = get_config()
-    config_dict = config.model_dump(mode="json", **kwargs)
-
     # Flatten to a string-only mapping that matches Lambda's env var expectations
-    flat_config = _flatten_config_dict(
-        config_dict,
-        config,
-        include_plain_secret_values=include_plain_secret_values,
-    )
+    flat_config: dict[str, Any] = _get_flat_config(include_plain_secret_values=include_plain_secret_values, **kwargs)
 
-    output_path = Path(get_project_basedir(), filename)
+    output_path = PROJECT_BASE_DIR / filename
     if in_aws_format:
         # Wrap in AWS Lambda env var format
         flat_config = {"Variables": flat_config}
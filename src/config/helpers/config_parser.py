@@ -9,8 +9,9 @@ from io import BytesIO, IOBase, StringIO
 from pathlib import Path
 from typing import TextIO
 
-from pydantic import validate_call
-from ruamel.yaml import YAML
+import yaml
+
+from utils.yaml_helpers import YamlSafeLoader
 
 
 def parse_yaml_raw_as_dict(raw: str | bytes | IOBase | TextIO) -> dict:
@@ -20,6 +21,13 @@ def parse_yaml_raw_as_dict(raw: str | bytes | IOBase | TextIO) -> dict:
     ----------
     raw : str or bytes or IOBase
         The YAML string or stream.
+
+    Notes
+    -----
+    Parsed with PyYAML's safe loader, which follows YAML 1.1 (as does ``yaml.safe_load`` used by pydantic-settings'
+    own YAML source), not YAML 1.2. Unquoted scalars resolve differently from a YAML 1.2 parser such as ruamel.yaml:
+    ``yes``/``no``/``on``/``off`` become booleans, ``010`` is octal (``8``), ``0o10`` stays a string and
+    ``1:30`` is a sexagesimal int (``90``). Quote such values to keep them as strings.
     """
     stream: IOBase
     if isinstance(raw, str):
@@ -30,13 +38,9 @@ def parse_yaml_raw_as_dict(raw: str | bytes | IOBase | TextIO) -> dict:
         stream = raw
     else:
         raise TypeError(f"Expected str, bytes or IO, but got {raw!r}")
-    reader = YAML(typ="safe", pure=True)  # YAML 1.2 support
-    objects = reader.load(stream)
+    return yaml.load(stream, Loader=YamlSafeLoader)
 
-    return objects
 
-
-@validate_call(config={"arbitrary_types_allowed": True})
 def parse_yaml_file_as_dict(file: Path | str | IOBase) -> dict:
     """Parse YAML file as the passed model type.
 
@@ -44,6 +48,10 @@ def parse_yaml_file_as_dict(file: Path | str | IOBase) -> dict:
     ----------
     file : Path or str or IOBase
         The file path or stream to read from.
+
+    Notes
+    -----
+    Uses YAML 1.1 scalar resolution - see ``parse_yaml_raw_as_dict``.
     """
     # Short-circuit
     if isinstance(file, IOBase):
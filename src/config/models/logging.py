@@ -1,27 +1,64 @@
 """Logging configuration model."""
 
+import functools
 import logging
-from enum import Enum
+import re
+from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+_DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-class LogLevel(str, Enum):
-    """Valid Python logging levels."""
+# Substrings that mark a format string as needing a trial format: "%{", "%(", ")" or "{"
+_FORMAT_MARKERS_RE = re.compile(r"%[{(]|[){]")
 
-    CRITICAL = "CRITICAL"
-    ERROR = "ERROR"
-    WARNING = "WARNING"
-    INFO = "INFO"
-    DEBUG = "DEBUG"
+# Attributes of a dummy record used to trial-format LOG_FORMAT. Built once - LogRecord() reads the clock, pid and
+# thread/process names on construction. "message" and "asctime" are only set by Formatter.format(), so add them here
+_TEST_RECORD_DICT = {
+    **logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg="test",
+        args=(),
+        exc_info=None,
+    ).__dict__,
+    "message": "test",
+    "asctime": "1970-01-01 00:00:00",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _check_format(v: str) -> None:
+    """
+    Trial-format ``v`` against the dummy record, raising ``ValueError`` if it is malformed.
+
+    The check is pure in ``v``, so results are memoized - every config reload re-validates the same format string.
+    Failures raise and are therefore never cached.
+    """
+    # Check for potentially dangerous format specifiers
+    if _FORMAT_MARKERS_RE.search(v):
+        try:
+            # Test the format string with dummy data
+            _ = v % _TEST_RECORD_DICT
+        except (KeyError, ValueError, TypeError) as e:
+            raise ValueError(f"Invalid log format string: {e}") from e
+
+
+# Valid Python logging levels. A Literal rather than an Enum: the level is only ever used as its string name
+LogLevel = Literal["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"]
 
 
 class LoggingConfig(BaseModel):
     """Configuration for application logging."""
 
-    LOG_LEVEL: LogLevel = LogLevel.INFO
+    # Immutable once loaded - the instance can be shared/passed by reference
+    model_config = ConfigDict(frozen=True)
+
+    LOG_LEVEL: LogLevel = "INFO"
     LOG_FORMAT: str = Field(
-        default="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        default=_DEFAULT_LOG_FORMAT,
         min_length=1,
         description="Python logging format string",
     )
@@ -48,20 +85,9 @@ class LoggingConfig(BaseModel):
         ValueError
             If the format string contains potentially unsafe patterns.
         """
-        # Check for potentially dangerous format specifiers
-        if any(dangerous in v for dangerous in ["%{", "%(", ")", "{"]):
-            try:
-                # Test the format string with dummy data
-                test_record = logging.LogRecord(
-                    name="test",
-                    level=logging.INFO,
-                    pathname="",
-                    lineno=0,
-                    msg="test",
-                    args=(),
-                    exc_info=None,
-                )
-                _ = v % test_record.__dict__
-            except (KeyError, ValueError, TypeError) as e:
-                raise ValueError(f"Invalid log format string: {e}") from e
+        # The default is known to be valid. Fields don't validate their default, so this only catches it being set
+        # explicitly (e.g. copied into config.yaml) - compared by value since that string is a different object
+        if v == _DEFAULT_LOG_FORMAT:
+            return v
+        _check_format(v)
         return v
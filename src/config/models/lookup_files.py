@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from config.helpers.base import RequiredFile
 
@@ -18,6 +18,13 @@ class LookupDataConfig(BaseModel):
     Uses the RequiredFile custom type which validates that the file exists
     and returns a Path object. Paths can be absolute, relative to the project
     base directory, or include user home directory references (~).
+
+    Successful existence checks are memoized per resolved path for the life of the process, so rebuilding the
+    config does not re-stat ``DATA_FILE_1``. A file deleted after it was verified keeps validating until
+    ``clear_verified_files()`` runs - ``clear_config_cache()`` calls it, direct ``LookupDataConfig()`` builds do not.
     """
 
+    # Immutable once loaded - paths are validated at load time and must not be swapped afterwards
+    model_config = ConfigDict(frozen=True)
+
     DATA_FILE_1: RequiredFile = Field("pyproject.toml", description="Path to a required data file.")
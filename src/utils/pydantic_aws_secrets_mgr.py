@@ -4,7 +4,6 @@ import json
 import os
 from typing import TYPE_CHECKING, Any
 
-import boto3
 from pydantic_settings import EnvSettingsSource
 from pydantic_settings.sources.utils import parse_env_vars
 
@@ -49,6 +48,10 @@ def _get_aws_credentials() -> dict[str, Any]:
 
 def get_aws_secret(secret_id: str) -> str:
     """Return the secret from AWS as a string for a given secret id."""
+    # Deferred import: boto3 is the heaviest import on the `import config` path and is only needed when
+    # AWS Secrets Manager is enabled as a config source
+    import boto3  # noqa: PLC0415
+
     client = boto3.Session(**_get_aws_credentials()).client("secretsmanager")
     response = client.get_secret_value(SecretId=secret_id)
     return response["SecretString"]
@@ -0,0 +1,59 @@
+from __future__ import annotations as _annotations  # important for BaseSettings import to work
+
+import copy
+from typing import TYPE_CHECKING, Any
+
+import yaml
+from pydantic_settings import YamlConfigSettingsSource
+
+from utils.yaml_helpers import YamlSafeLoader
+
+if TYPE_CHECKING:
+    from importlib.abc import Traversable
+    from pathlib import Path
+
+
+# Parsed YAML files keyed on path, stored with the (mtime_ns, size) they were parsed at. An edited file replaces its
+# entry, so the cache holds at most one parsed dict per path
+_YAML_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+
+class CachedYamlConfigSettingsSource(YamlConfigSettingsSource):
+    """
+    YAML settings source that parses each unchanged file only once per process.
+
+    Notes
+    -----
+    ``get_config()`` is cached, but every ``AppConfig()`` instantiation (tests, CLI tools clearing the cache) builds
+    a fresh YAML source which re-reads and re-parses ``config.yaml``. Each read returns a deep copy of the cached
+    parse, since ``Any``-typed fields keep references to the parsed values and would otherwise leak mutations into
+    later builds - copying is still ~10x cheaper than re-parsing.
+
+    Files are parsed with PyYAML's libyaml-backed ``CSafeLoader`` instead of ``yaml.safe_load``, which
+    pydantic-settings uses by default and which runs the pure-Python scanner/parser.
+    """
+
+    def _parse_file(self, file_path: Path | Traversable) -> dict[str, Any]:
+        with file_path.open(encoding=self.yaml_file_encoding) as yaml_file:
+            return yaml.load(yaml_file, Loader=YamlSafeLoader) or {}
+
+    def _read_file(self, file_path: Path | Traversable) -> dict[str, Any]:
+        stat = getattr(file_path, "stat", None)
+        if stat is None:
+            # Traversable resources carry no stat info to key the cache on
+            return self._parse_file(file_path)
+
+        file_stat = stat()
+        key = str(file_path)
+        cached = _YAML_CACHE.get(key)
+        if cached is not None and cached[:2] == (file_stat.st_mtime_ns, file_stat.st_size):
+            return copy.deepcopy(cached[2])
+
+        data = self._parse_file(file_path)
+        _YAML_CACHE[key] = (file_stat.st_mtime_ns, file_stat.st_size, data)
+        return copy.deepcopy(data)
+
+
+__all__ = [
+    "CachedYamlConfigSettingsSource",
+]
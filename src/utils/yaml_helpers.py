@@ -0,0 +1,18 @@
+"""PyYAML loader/dumper selection shared by the YAML settings source, parser and exporter."""
+
+try:
+    # libyaml-backed C implementations; fall back to the pure-Python ones when PyYAML is built without libyaml
+    from yaml import (
+        CSafeDumper as YamlSafeDumper,
+        CSafeLoader as YamlSafeLoader,
+    )
+except ImportError:  # pragma: no cover
+    from yaml import (
+        SafeDumper as YamlSafeDumper,  # type: ignore[assignment]
+        SafeLoader as YamlSafeLoader,  # type: ignore[assignment]
+    )
+
+__all__ = [
+    "YamlSafeDumper",
+    "YamlSafeLoader",
+]
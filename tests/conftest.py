@@ -1,9 +1,72 @@
 import os
+import sys
 import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
+SRC_DIR = str(Path(__file__).resolve().parent.parent / "src")
+
+# Add src to path for imports - conftest is loaded once, before any test module is collected
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+if TYPE_CHECKING:
+    from config.models.consolidated import AppConfig
+
+# Env vars the tests set - cleared before and restored after each test by clean_env
+TEST_ENV_VARS = (
+    "SERVICE_NAME",
+    "DB__HOST",
+    "DB__USERNAME",
+    "DB__PASSWORD",
+    "AWS_CONFIG__S3_BUCKET_NAMES__BUCKET_A",
+    "LLM__OPENAI_MODEL_CONFIG__OPENAI_API_KEY",
+)
+
+# Bytes so the fixture writes it without a text-encoding layer
+SAMPLE_ENV_CONTENT = b"""# Sample environment variables
+# Copy this file to .env and modify the values as needed
+
+SERVICE_NAME="sample_service_name"
+DB__HOST="sample.host.com"
+DB__USERNAME="sample_username"
+DB__PASSWORD="sample_password"
+AWS_CONFIG__S3_BUCKET_NAMES__BUCKET_A="sample-bucket"
+LLM__OPENAI_MODEL_CONFIG__OPENAI_API_KEY="sk-sample-api-key"
+"""
+
+
+def build_isolated_config(env_file: Path, env: dict[str, str] | None = None) -> "AppConfig":
+    """
+    Build a fresh AppConfig from ``env_file`` with only ``env`` set among the test env vars.
+
+    For fixtures wider than function scope, which can't use ``clean_env``/``monkeypatch``. ``TEST_ENV_VARS`` are
+    cleared so ambient values don't leak in, ``env`` is applied on top, and the environment is restored before
+    returning. The config is built directly rather than through the ``get_config()`` cache.
+
+    Parameters
+    ----------
+    env_file : Path
+        The dotenv file to load, passed as ``_env_file``.
+    env : dict[str, str], optional
+        Environment variables to set while building the config, by default None.
+
+    Returns
+    -------
+    AppConfig
+        The loaded configuration.
+    """
+    from config.models.consolidated import AppConfig  # noqa: PLC0415 - importable only after the sys.path insert
+
+    with pytest.MonkeyPatch.context() as mp:
+        for var in TEST_ENV_VARS:
+            mp.delenv(var, raising=False)
+        for var, value in (env or {}).items():
+            mp.setenv(var, value)
+        return AppConfig(_env_file=env_file)
+
 
 @pytest.fixture
 def temp_project_dir():
@@ -15,27 +78,17 @@ def temp_project_dir():
 @pytest.fixture
 def clean_env():
     """Clean environment variables before and after test."""
-    # Store original env vars
-    original_env = dict(os.environ)
-
-    # Clean test-related env vars
-    test_vars = [
-        "SERVICE_NAME",
-        "DB__HOST",
-        "DB__USERNAME",
-        "DB__PASSWORD",
-        "AWS_CONFIG__S3_BUCKET_NAMES__BUCKET_A",
-        "LLM__OPENAI_MODEL_CONFIG__OPENAI_API_KEY",
-    ]
-
-    for var in test_vars:
-        os.environ.pop(var, None)
+    # Clean test-related env vars, storing only their original values rather than a copy of the whole environment
+    saved = {var: os.environ.pop(var, None) for var in TEST_ENV_VARS}
 
     yield
 
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
+    # Restore original values, removing vars that were unset before the test
+    for var, value in saved.items():
+        if value is None:
+            os.environ.pop(var, None)
+        else:
+            os.environ[var] = value
 
 
 @pytest.fixture
@@ -53,26 +106,16 @@ def temp_dotenv_file(temp_project_dir):
     return env_file
 
 
-@pytest.fixture
-def sample_env_file(temp_project_dir):
-    """Create a temporary sample .env file for testing."""
-    env_file = temp_project_dir / ".env.sample"
-
-    # Create sample content
-    sample_content = """# Sample environment variables
-# Copy this file to .env and modify the values as needed
-
-SERVICE_NAME="sample_service_name"
-DB__HOST="sample.host.com"
-DB__USERNAME="sample_username"
-DB__PASSWORD="sample_password"
-AWS_CONFIG__S3_BUCKET_NAMES__BUCKET_A="sample-bucket"
-LLM__OPENAI_MODEL_CONFIG__OPENAI_API_KEY="sk-sample-api-key"
-"""
+@pytest.fixture(scope="session")
+def sample_env_file(tmp_path_factory):
+    """Create a sample .env file once per session - the content never changes and tests only read it."""
+    env_file = tmp_path_factory.mktemp("sample_env") / ".env.sample"
+    env_file.write_bytes(SAMPLE_ENV_CONTENT)
+    # Removed with the rest of the session's temp directories
+    return env_file
 
-    env_file.write_text(sample_content)
-    yield env_file
 
-    # Cleanup after test
-    if env_file.exists():
-        env_file.unlink()
+@pytest.fixture(scope="session")
+def shared_config(sample_env_file):
+    """Build a config from the sample .env file once per session, for tests that only read it."""
+    return build_isolated_config(sample_env_file)
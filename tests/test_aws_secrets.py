@@ -0,0 +1,20 @@
+from unittest.mock import patch
+
+from config import clear_config_cache
+from config.helpers.aws_secrets import should_use_aws_secrets_as_config_source
+
+
+class TestProjectDotenvLoading:
+    """Test that the project .env file is read once per config build cycle."""
+
+    def test_dotenv_is_reloaded_after_clear_config_cache(self):
+        """Test that repeated checks read .env once and clear_config_cache() makes the next check read it again."""
+        clear_config_cache()
+        with patch("config.helpers.aws_secrets.load_dotenv") as load_dotenv:
+            should_use_aws_secrets_as_config_source()
+            should_use_aws_secrets_as_config_source()
+            assert load_dotenv.call_count == 1
+
+            clear_config_cache()
+            should_use_aws_secrets_as_config_source()
+            assert load_dotenv.call_count == 2
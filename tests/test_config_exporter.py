@@ -0,0 +1,21 @@
+from unittest.mock import patch
+
+import pytest
+
+from config.helpers.config_exporter import _get_flat_config
+
+
+class TestFlatConfigExport:
+    """Test that the flat (dotenv/JSON) export does not depend on whether dump options are passed."""
+
+    @pytest.mark.parametrize("include_plain_secret_values", [False, True])
+    def test_plain_export_matches_export_with_dump_options(self, shared_config, include_plain_secret_values):
+        """Test that an export without options equals one with a no-op ``model_dump`` option."""
+        with patch("config.helpers.config_exporter.get_config", return_value=shared_config):
+            plain = _get_flat_config(include_plain_secret_values=include_plain_secret_values)
+            with_options = _get_flat_config(
+                include_plain_secret_values=include_plain_secret_values,
+                exclude_none=False,
+            )
+
+        assert plain == with_options
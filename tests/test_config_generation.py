@@ -1,12 +1,7 @@
-import sys
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from config import get_config
 from config.models.consolidated import AppConfig
 
@@ -23,22 +18,26 @@ class TestConfigGeneration:
 
     def test_get_config_returns_appconfig_instance(self, clean_env, sample_env_file):
         """Test that get_config returns a valid AppConfig instance."""
-        # Use sample .env file to avoid interference
-        with patch("config.helpers.base.PATH_ENV", sample_env_file):
+        # Point the dotenv source at the sample file - env_file is read from model_config when the config is built
+        with patch.dict(AppConfig.model_config, {"env_file": sample_env_file}):
             config = get_config()
-            assert isinstance(config, AppConfig)
 
-    def test_config_has_required_sections(self, clean_env, sample_env_file):
+        assert isinstance(config, AppConfig)
+        assert config.SERVICE_NAME == "sample_service_name"
+
+    def test_config_has_required_sections(self, shared_config):
         """Test that config has all required top-level sections."""
-        with patch("config.helpers.base.PATH_ENV", sample_env_file):
-            config = get_config()
+        # Check that all major sections exist
+        assert hasattr(shared_config, "SERVICE_NAME")
+        assert hasattr(shared_config, "DB")
+        assert hasattr(shared_config, "AWS_CONFIG")
+        assert hasattr(shared_config, "LLM")
+        assert hasattr(shared_config, "LOOKUP_DATA")
 
-            # Check that all major sections exist
-            assert hasattr(config, "SERVICE_NAME")
-            assert hasattr(config, "DB")
-            assert hasattr(config, "AWS_CONFIG")
-            assert hasattr(config, "LLM")
-            assert hasattr(config, "LOOKUP_DATA")
+    def test_shared_config_reads_sample_env_file(self, shared_config):
+        """Test that the session config is loaded from the sample .env file rather than the defaults."""
+        assert shared_config.SERVICE_NAME == "sample_service_name"
+        assert shared_config.DB.HOST == "sample.host.com"
 
     def test_config_default_values(self, clean_env):
         """Test that config loads with expected default values."""
@@ -51,20 +50,18 @@ class TestConfigGeneration:
         # pyrefly: ignore  # missing-attribute
         assert config.LLM.VERBOSITY is False
 
-    def test_config_caching(self, clean_env, sample_env_file):
+    def test_config_caching(self, clean_env):
         """Test that get_config returns the same instance (caching works)."""
-        with patch("config.helpers.base.PATH_ENV", sample_env_file):
-            config1 = get_config()
-            config2 = get_config()
+        config1 = get_config()
+        config2 = get_config()
 
-            # Should be the same object due to caching
-            assert config1 is config2
+        # Should be the same object due to caching
+        assert config1 is config2
 
-    def test_config_model_validation(self, clean_env, sample_env_file):
+    def test_config_model_validation(self, clean_env):
         """Test that config passes Pydantic validation."""
-        with patch("config.helpers.base.PATH_ENV", sample_env_file):
-            config = get_config()
+        config = get_config()
 
-            # This should not raise any validation errors
-            validated_data = config.model_validate(config.model_dump())
-            assert validated_data is not None
+        # This should not raise any validation errors
+        validated_data = config.model_validate(config.model_dump())
+        assert validated_data is not None
@@ -0,0 +1,25 @@
+import pytest
+from pydantic import ValidationError
+
+from config.models.logging import LoggingConfig
+
+
+class TestLoggingConfig:
+    """Test LOG_FORMAT validation."""
+
+    @pytest.mark.parametrize(
+        "log_format",
+        [
+            "%(asctime)s %(message)s",
+            "%(levelname)s - %(name)s - %(message)s",
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        ],
+    )
+    def test_valid_format_is_accepted(self, log_format):
+        """Test that formats using standard record attributes, including message and asctime, validate."""
+        assert LoggingConfig(LOG_FORMAT=log_format).LOG_FORMAT == log_format
+
+    def test_unknown_record_attribute_is_rejected(self):
+        """Test that a format referencing a non-existent record attribute is rejected."""
+        with pytest.raises(ValidationError, match="Invalid log format string"):
+            LoggingConfig(LOG_FORMAT="%(bogus)s")
@@ -0,0 +1,26 @@
+import pytest
+from pydantic import ValidationError
+
+from config import clear_config_cache
+from config.models.lookup_files import LookupDataConfig
+
+
+class TestRequiredFile:
+    """Test RequiredFile existence validation."""
+
+    def test_missing_file_is_rejected(self, tmp_path):
+        """Test that a path to a non-existent file fails validation."""
+        with pytest.raises(ValidationError, match="File not found at path"):
+            LookupDataConfig(DATA_FILE_1=tmp_path / "missing.csv")
+
+    def test_deleted_file_fails_on_rebuild(self, tmp_path):
+        """Test that a verified file deleted afterwards is detected once the config cache is cleared."""
+        data_file = tmp_path / "data.csv"
+        data_file.write_text("id,value\n")
+        LookupDataConfig(DATA_FILE_1=data_file)
+
+        data_file.unlink()
+        clear_config_cache()
+
+        with pytest.raises(ValidationError, match="File not found at path"):
+            LookupDataConfig(DATA_FILE_1=data_file)
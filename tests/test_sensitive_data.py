@@ -1,15 +1,30 @@
-import os
-import sys
-from pathlib import Path
+import re
+from typing import Any, NamedTuple
 from unittest.mock import patch
 
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from config import get_config
 from config.helpers.config_exporter import dump_config_to_yaml
+from config.helpers.config_parser import parse_yaml_raw_as_dict
+from config.models.consolidated import AppConfig
+from tests.conftest import build_isolated_config
+
+# Sensitive values set once for the read-only masking tests in TestSecretMaskingInDumps
+SECRET_ENV = {
+    "DB__USERNAME": "secret_username",
+    "DB__PASSWORD": "secret_password",
+    "LLM__OPENAI_MODEL_CONFIG__OPENAI_API_KEY": "sk-secret-api-key",
+}
+
+
+class DumpedConfig(NamedTuple):
+    """A config together with each of its dumps."""
+
+    config: AppConfig
+    python_dict: dict[str, Any]
+    json_dict: dict[str, Any]
+    json_str: str
 
 
 class TestSensitiveDataHandling:
@@ -28,37 +43,10 @@ class TestSensitiveDataHandling:
         # Clear cache after test
         get_config.cache_clear()
 
-    def test_secret_str_fields_are_masked_in_model_dump(self, clean_env):
-        """Test that SecretStr fields are properly masked in model dumps."""
-        # Set some sensitive values
-        os.environ["DB__USERNAME"] = "secret_username"
-        os.environ["DB__PASSWORD"] = "secret_password"
-        os.environ["LLM__OPENAI_MODEL_CONFIG__OPENAI_API_KEY"] = "sk-secret-api-key"
-
-        config = get_config()
-        config_dict = config.model_dump()
-
-        # Check that sensitive fields are masked
-        assert str(config_dict["DB"]["USERNAME"]) == "**********"
-        assert str(config_dict["DB"]["PASSWORD"]) == "**********"
-        assert str(config_dict["LLM"]["OPENAI_MODEL_CONFIG"]["OPENAI_API_KEY"]) == "**********"
-
-    def test_secret_str_fields_are_masked_in_json_dump(self, clean_env):
-        """Test that SecretStr fields are masked in JSON mode dumps."""
-        os.environ["DB__USERNAME"] = "secret_username"
-        os.environ["LLM__OPENAI_MODEL_CONFIG__OPENAI_API_KEY"] = "sk-secret-api-key"
-
-        config = get_config()
-        config_dict = config.model_dump(mode="json")
-
-        # Check that sensitive fields are masked in JSON mode too
-        assert config_dict["DB"]["USERNAME"] == "**********"
-        assert config_dict["LLM"]["OPENAI_MODEL_CONFIG"]["OPENAI_API_KEY"] == "**********"
-
-    def test_actual_secret_values_are_accessible(self, clean_env):
+    def test_actual_secret_values_are_accessible(self, monkeypatch):
         """Test that actual secret values are accessible through get_secret_value()."""
-        os.environ["DB__USERNAME"] = "actual_username"
-        os.environ["DB__PASSWORD"] = "actual_password"
+        monkeypatch.setenv("DB__USERNAME", "actual_username")
+        monkeypatch.setenv("DB__PASSWORD", "actual_password")
 
         config = get_config()
 
@@ -70,10 +58,10 @@ class TestSensitiveDataHandling:
         assert str(config.DB.USERNAME) == "**********"
         assert str(config.DB.PASSWORD) == "**********"
 
-    def test_dump_config_to_yaml_masks_secrets(self, clean_env, temp_project_dir):
+    def test_dump_config_to_yaml_masks_secrets(self, monkeypatch, temp_project_dir):
         """Test that dump_config_to_yaml properly masks sensitive information."""
-        os.environ["DB__USERNAME"] = "secret_db_user"
-        os.environ["LLM__OPENAI_MODEL_CONFIG__OPENAI_API_KEY"] = "sk-secret-key"
+        monkeypatch.setenv("DB__USERNAME", "secret_db_user")
+        monkeypatch.setenv("LLM__OPENAI_MODEL_CONFIG__OPENAI_API_KEY", "sk-secret-key")
 
         # Mock PROJECT_BASE_DIR for testing
         from unittest.mock import patch  # noqa: PLC0415
@@ -90,7 +78,20 @@ class TestSensitiveDataHandling:
             assert "sk-secret-key" not in content
             assert "**********" in content
 
-    def test_no_sensitive_data_in_yaml_output(self, clean_env, temp_project_dir):
+    def test_dump_config_to_yaml_without_comments_masks_secrets(self, monkeypatch, temp_project_dir):
+        """Test that the comment-free YAML export masks secrets and round-trips the config values."""
+        monkeypatch.setenv("DB__USERNAME", "secret_db_user")
+
+        with patch("config.helpers.config_exporter.PROJECT_BASE_DIR", temp_project_dir):
+            dump_config_to_yaml("plain_config.yaml", include_comments=False)
+
+            content = (temp_project_dir / "plain_config.yaml").read_text()
+
+            assert "secret_db_user" not in content
+            assert "#" not in content
+            assert parse_yaml_raw_as_dict(content) == get_config().model_dump(mode="json")
+
+    def test_no_sensitive_data_in_yaml_output(self, monkeypatch, temp_project_dir):
         """Test that YAML output contains no actual sensitive values."""
         # Set various sensitive values
         sensitive_values = [
@@ -100,8 +101,8 @@ class TestSensitiveDataHandling:
             "secret_api_token",
         ]
 
-        os.environ["DB__PASSWORD"] = sensitive_values[0]
-        os.environ["LLM__OPENAI_MODEL_CONFIG__OPENAI_API_KEY"] = sensitive_values[1]
+        monkeypatch.setenv("DB__PASSWORD", sensitive_values[0])
+        monkeypatch.setenv("LLM__OPENAI_MODEL_CONFIG__OPENAI_API_KEY", sensitive_values[1])
 
         from unittest.mock import patch  # noqa: PLC0415
 
@@ -111,27 +112,55 @@ class TestSensitiveDataHandling:
             config_file = temp_project_dir / "security_test.yaml"
             content = config_file.read_text()
 
-            # Verify none of the sensitive values appear in the output
-            for sensitive_value in sensitive_values:
-                assert sensitive_value not in content, f"Sensitive value '{sensitive_value}' found in YAML output"
+            # Verify none of the sensitive values appear in the output - one scan for all of them
+            leaked = re.compile("|".join(map(re.escape, sensitive_values))).search(content)
+            assert leaked is None, f"Sensitive value '{leaked.group()}' found in YAML output"
 
-    def test_model_dump_json_preserves_masking(self, clean_env):
-        """Test that JSON dumps also preserve secret masking."""
-        os.environ["DB__USERNAME"] = "json_test_user"
 
-        config = get_config()
-        json_str = config.model_dump_json()
+@pytest.fixture(scope="class")
+def dumped_config(sample_env_file):
+    """Load the config with SECRET_ENV set and dump it in every mode once."""
+    config = build_isolated_config(sample_env_file, SECRET_ENV)
+    return DumpedConfig(
+        config=config,
+        python_dict=config.model_dump(),
+        json_dict=config.model_dump(mode="json"),
+        json_str=config.model_dump_json(),
+    )
+
+
+class TestSecretMaskingInDumps:
+    """Test that dumps of a loaded config mask its secrets - the config is built and dumped once for the class."""
+
+    def test_secret_str_fields_are_masked_in_model_dump(self, dumped_config):
+        """Test that SecretStr fields are properly masked in model dumps."""
+        config_dict = dumped_config.python_dict
+
+        # Check that sensitive fields are masked
+        assert str(config_dict["DB"]["USERNAME"]) == "**********"
+        assert str(config_dict["DB"]["PASSWORD"]) == "**********"
+        assert str(config_dict["LLM"]["OPENAI_MODEL_CONFIG"]["OPENAI_API_KEY"]) == "**********"
+
+    def test_secret_str_fields_are_masked_in_json_dump(self, dumped_config):
+        """Test that SecretStr fields are masked in JSON mode dumps."""
+        config_dict = dumped_config.json_dict
+
+        # Check that sensitive fields are masked in JSON mode too
+        assert config_dict["DB"]["USERNAME"] == "**********"
+        assert config_dict["LLM"]["OPENAI_MODEL_CONFIG"]["OPENAI_API_KEY"] == "**********"
+
+    def test_model_dump_json_preserves_masking(self, dumped_config):
+        """Test that JSON dumps also preserve secret masking."""
+        json_str = dumped_config.json_str
 
-        # Check that the actual secret is not in the JSON string
-        assert "json_test_user" not in json_str
+        # Check that the actual secrets are not in the JSON string
+        for secret in SECRET_ENV.values():
+            assert secret not in json_str
         assert "**********" in json_str
 
-    def test_nested_secret_fields_are_masked(self, clean_env):
+    def test_nested_secret_fields_are_masked(self, dumped_config):
         """Test that nested SecretStr fields are properly masked."""
-        os.environ["LLM__OPENAI_MODEL_CONFIG__OPENAI_API_KEY"] = "nested_secret_key"
-
-        config = get_config()
-        config_dict = config.model_dump()
+        config_dict = dumped_config.python_dict
 
         # Check nested structure
         assert "LLM" in config_dict
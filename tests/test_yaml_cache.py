@@ -0,0 +1,78 @@
+import os
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
+
+from utils import pydantic_yaml_cache
+from utils.pydantic_yaml_cache import CachedYamlConfigSettingsSource
+
+
+class YamlOnlySettings(BaseSettings):
+    """Settings loaded from a single YAML file through the cached source."""
+
+    NAME: str = "default"
+    EXTRA: dict[str, Any] = {}
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Read settings from the YAML file only."""
+        return (CachedYamlConfigSettingsSource(settings_cls),)
+
+
+class TestCachedYamlConfigSettingsSource:
+    """Test that the cached YAML source parses unchanged files once and picks up edits."""
+
+    @pytest.fixture
+    def yaml_file(self, tmp_path):
+        """Create a YAML file and a settings class reading it."""
+        yaml_file = tmp_path / "config.yaml"
+        yaml_file.write_text("NAME: first\nEXTRA:\n  ITEMS: [a, b]\n")
+        with patch.dict(YamlOnlySettings.model_config, SettingsConfigDict(yaml_file=yaml_file)):
+            yield yaml_file
+        pydantic_yaml_cache._YAML_CACHE.pop(str(yaml_file), None)
+
+    def test_unchanged_file_is_parsed_once(self, yaml_file):
+        """Test that repeated builds reuse the parsed file."""
+        with patch.object(
+            CachedYamlConfigSettingsSource,
+            "_parse_file",
+            autospec=True,
+            side_effect=CachedYamlConfigSettingsSource._parse_file,
+        ) as parse_file:
+            assert YamlOnlySettings().NAME == "first"
+            assert YamlOnlySettings().NAME == "first"
+
+        assert parse_file.call_count == 1
+
+    def test_edited_file_is_reparsed_and_replaces_entry(self, yaml_file):
+        """Test that an edited file is parsed again and its old entry is dropped."""
+        assert YamlOnlySettings().NAME == "first"
+        entries_before = len(pydantic_yaml_cache._YAML_CACHE)
+
+        yaml_file.write_text("NAME: second\n")
+        # Force a different mtime in case the edit lands within the filesystem's timestamp resolution
+        stat = yaml_file.stat()
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert YamlOnlySettings().NAME == "second"
+        # The edit replaced the file's entry rather than adding a second one
+        assert len(pydantic_yaml_cache._YAML_CACHE) == entries_before
+        assert pydantic_yaml_cache._YAML_CACHE[str(yaml_file)][2] == {"NAME": "second"}
+
+    def test_cached_data_is_not_mutated_across_builds(self, yaml_file):
+        """Test that mutating a loaded config does not leak into the cache or later builds."""
+        config = YamlOnlySettings()
+        config.EXTRA["ITEMS"].append("c")
+        config.EXTRA["NEW"] = 1
+
+        assert pydantic_yaml_cache._YAML_CACHE[str(yaml_file)][2] == {"NAME": "first", "EXTRA": {"ITEMS": ["a", "b"]}}
+        assert YamlOnlySettings().EXTRA == {"ITEMS": ["a", "b"]}